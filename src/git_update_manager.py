@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import re
+from functools import lru_cache
 import requests
 
 def get_repository_config(workflow_type: str = None) -> dict:
@@ -73,6 +74,11 @@ def detect_script_repository_config(script_path: Path) -> dict:
     # Default to SIP workflow for backward compatibility
     return get_repository_config('sip')
 
+@lru_cache(maxsize=64)
+def _parse_version(version: str) -> tuple:
+    """Parse a dotted version string such as 'v1.2.3' into a tuple of ints."""
+    return tuple(int(x) for x in version.lstrip('v').split('.'))
+
 class GitUpdateManager:
     """Unified update manager using Git repositories and GitHub releases."""
     
@@ -90,6 +96,11 @@ class GitUpdateManager:
         self.cache_ttl = cache_ttl
         self._cache = {}
         self._last_check_time = None
+        # Created on first API call and reused so repeated checks keep the connection alive
+        self._session = None
+        # Last release payload and its ETag, for conditional GitHub API requests
+        self._release_etag = None
+        self._last_release = None
         
         # Repository configuration - scripts use tags, application uses commits for active development
         if repo_type == "scripts":
@@ -207,11 +218,20 @@ class GitUpdateManager:
             # For now, try without auth (works if repo is public or has public releases)
             api_url = f"{self.config['api_url']}/releases/latest"
             
-            response = requests.get(api_url, timeout=timeout)
+            # Send the last ETag so an unchanged release comes back as a bodyless 304
+            headers = {}
+            if self._release_etag and self._last_release is not None:
+                headers['If-None-Match'] = self._release_etag
+            
+            if self._session is None:
+                self._session = requests.Session()
+            response = self._session.get(api_url, headers=headers, timeout=timeout)
             
-            if response.status_code == 200:
+            if response.status_code == 304:
+                return self._last_release
+            elif response.status_code == 200:
                 release_data = response.json()
-                return {
+                self._last_release = {
                     'tag_name': release_data.get('tag_name', ''),
                     'name': release_data.get('name', ''),
                     'body': release_data.get('body', ''),
@@ -220,6 +240,8 @@ class GitUpdateManager:
                     'zipball_url': release_data.get('zipball_url', ''),
                     'tarball_url': release_data.get('tarball_url', '')
                 }
+                self._release_etag = response.headers.get('ETag')
+                return self._last_release
             elif response.status_code == 404:
                 # No releases found or private repo without access
                 return None
@@ -300,6 +322,10 @@ class GitUpdateManager:
     
     def compare_versions(self, current: str, latest: str) -> bool:
         """Compare version strings (semantic versioning or commit hashes)."""
+        # Identical strings are never an update, whatever the version scheme
+        if current == latest:
+            return False
+        
         try:
             # For commit-based comparison (application repository)
             if self.config["current_version_source"] == "commit_hash":
@@ -308,31 +334,19 @@ class GitUpdateManager:
                 return current != latest
             
             # For tag-based comparison (scripts repository)
-            # Remove 'v' prefix if present
-            current = current.lstrip('v')
-            latest = latest.lstrip('v')
+            current_parts = _parse_version(current)
+            latest_parts = _parse_version(latest)
             
-            # Split versions into parts
-            current_parts = [int(x) for x in current.split('.')]
-            latest_parts = [int(x) for x in latest.split('.')]
-            
-            # Pad shorter version with zeros
+            # Pad shorter version with zeros so "1.0" == "1.0.0"
             max_length = max(len(current_parts), len(latest_parts))
-            current_parts.extend([0] * (max_length - len(current_parts)))
-            latest_parts.extend([0] * (max_length - len(latest_parts)))
-            
-            # Compare each part
-            for curr, lat in zip(current_parts, latest_parts):
-                if lat > curr:
-                    return True
-                elif lat < curr:
-                    return False
+            current_parts += (0,) * (max_length - len(current_parts))
+            latest_parts += (0,) * (max_length - len(latest_parts))
             
-            return False  # Versions are equal
+            return latest_parts > current_parts
             
         except ValueError:
             # Fallback to string comparison
-            return latest > current
+            return latest.lstrip('v') > current.lstrip('v')
     
     def check_for_updates(self, timeout: int = 10) -> Dict[str, Any]:
         """Check for available updates."""
@@ -549,6 +563,14 @@ class GitUpdateManager:
     def clear_cache(self) -> None:
         """Clear all cached results."""
         self._cache.clear()
+        self._release_etag = None
+        self._last_release = None
+    
+    def close(self) -> None:
+        """Close the HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
 # Factory function for easy instantiation
 def create_update_managers(base_path: Path = None, script_path: Path = None, workflow_type: str = None) -> Dict[str, GitUpdateManager]:
@@ -4,8 +4,6 @@ from unittest.mock import patch
 
 import pytest
 
-# Add src to path to allow imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # This is a bit of a hack to allow importing app.py
 # which is not a module.
@@ -9,312 +9,267 @@ Following TDD methodology:
 3. Validate and optimize (REFACTOR)
 """
 
-import os
 import pytest
-import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+_APP_PY = Path(__file__).parent.parent / "app.py"
+
+pytestmark = pytest.mark.skipif(not _APP_PY.exists(), reason="app.py missing")
+
+
+@pytest.fixture(scope="session")
+def app_py_content():
+    """Contents of app.py, read once for all tests."""
+    return _APP_PY.read_text()
 
 
 class TestAppPyDockerRemoval:
     """Test that Docker environment detection is removed from app.py."""
     
-    def test_no_docker_validation_imports(self):
+    def test_no_docker_validation_imports(self, app_py_content):
         """Test that Docker validation imports are removed."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check that Docker validation imports are removed
-                docker_imports = [
-                    'from utils.docker_validation import',
-                    'import utils.docker_validation',
-                    'validate_docker_environment',
-                    'display_environment_status'
-                ]
-                for docker_import in docker_imports:
-                    assert docker_import not in content, f"Docker import '{docker_import}' should be removed from app.py"
+        content = app_py_content
+        # Check that Docker validation imports are removed
+        docker_imports = [
+            'from utils.docker_validation import',
+            'import utils.docker_validation',
+            'validate_docker_environment',
+            'display_environment_status'
+        ]
+        for docker_import in docker_imports:
+            assert docker_import not in content, f"Docker import '{docker_import}' should be removed from app.py"
     
-    def test_no_docker_environment_validation_calls(self):
+    def test_no_docker_environment_validation_calls(self, app_py_content):
         """Test that Docker environment validation calls are removed."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check that Docker validation function calls are removed
-                docker_calls = [
-                    'validate_docker_environment()',
-                    'display_environment_status()',
-                    'docker_validation'
-                ]
-                for docker_call in docker_calls:
-                    assert docker_call not in content, f"Docker call '{docker_call}' should be removed from app.py"
+        content = app_py_content
+        # Check that Docker validation function calls are removed
+        docker_calls = [
+            'validate_docker_environment()',
+            'display_environment_status()',
+            'docker_validation'
+        ]
+        for docker_call in docker_calls:
+            assert docker_call not in content, f"Docker call '{docker_call}' should be removed from app.py"
     
-    def test_no_docker_status_display(self):
+    def test_no_docker_status_display(self, app_py_content):
         """Test that Docker status display is removed."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for Docker status display elements
-                docker_status_elements = [
-                    'Docker Status',
-                    'docker_status',
-                    'container status',
-                    'Docker Desktop'
-                ]
-                for element in docker_status_elements:
-                    assert element not in content, f"Docker status element '{element}' should be removed from app.py"
+        content = app_py_content
+        # Check for Docker status display elements
+        docker_status_elements = [
+            'Docker Status',
+            'docker_status',
+            'container status',
+            'Docker Desktop'
+        ]
+        for element in docker_status_elements:
+            assert element not in content, f"Docker status element '{element}' should be removed from app.py"
 
 
 class TestAppPyStreamlitFunctionality:
     """Test that Streamlit functionality is preserved in app.py."""
     
-    def test_streamlit_imports_preserved(self):
+    def test_streamlit_imports_preserved(self, app_py_content):
         """Test that Streamlit imports are preserved."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for essential Streamlit imports
-                streamlit_imports = [
-                    'import streamlit',
-                    'streamlit as st'
-                ]
-                has_streamlit = any(imp in content for imp in streamlit_imports)
-                assert has_streamlit, "Streamlit imports should be preserved in app.py"
+        content = app_py_content
+        # Check for essential Streamlit imports
+        streamlit_imports = [
+            'import streamlit',
+            'streamlit as st'
+        ]
+        has_streamlit = any(imp in content for imp in streamlit_imports)
+        assert has_streamlit, "Streamlit imports should be preserved in app.py"
     
-    def test_workflow_type_display_preserved(self):
+    def test_workflow_type_display_preserved(self, app_py_content):
         """Test that workflow type display functionality is preserved."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for workflow type display (title functionality)
-                workflow_display_indicators = [
-                    'WORKFLOW_TYPE',
-                    'workflow_type',
-                    'title',
-                    'SIP',
-                    'SPS'
-                ]
-                has_workflow_display = any(indicator in content for indicator in workflow_display_indicators)
-                assert has_workflow_display, "Workflow type display should be preserved in app.py"
+        content = app_py_content
+        # Check for workflow type display (title functionality)
+        workflow_display_indicators = [
+            'WORKFLOW_TYPE',
+            'workflow_type',
+            'title',
+            'SIP',
+            'SPS'
+        ]
+        has_workflow_display = any(indicator in content for indicator in workflow_display_indicators)
+        assert has_workflow_display, "Workflow type display should be preserved in app.py"
     
-    def test_core_streamlit_components_preserved(self):
+    def test_core_streamlit_components_preserved(self, app_py_content):
         """Test that core Streamlit components are preserved."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for core Streamlit components
-                streamlit_components = [
-                    'st.title',
-                    'st.sidebar',
-                    'st.button',
-                    'st.selectbox'
-                ]
-                preserved_components = [comp for comp in streamlit_components if comp in content]
-                assert len(preserved_components) > 0, "Core Streamlit components should be preserved in app.py"
+        content = app_py_content
+        # Check for core Streamlit components
+        streamlit_components = [
+            'st.title',
+            'st.sidebar',
+            'st.button',
+            'st.selectbox'
+        ]
+        preserved_components = [comp for comp in streamlit_components if comp in content]
+        assert len(preserved_components) > 0, "Core Streamlit components should be preserved in app.py"
     
-    def test_project_management_preserved(self):
+    def test_project_management_preserved(self, app_py_content):
         """Test that project management functionality is preserved."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for project management functionality
-                project_management_indicators = [
-                    'project',
-                    'Project',
-                    'PROJECT_PATH',
-                    'project_path'
-                ]
-                has_project_management = any(indicator in content for indicator in project_management_indicators)
-                assert has_project_management, "Project management functionality should be preserved in app.py"
+        content = app_py_content
+        # Check for project management functionality
+        project_management_indicators = [
+            'project',
+            'Project',
+            'PROJECT_PATH',
+            'project_path'
+        ]
+        has_project_management = any(indicator in content for indicator in project_management_indicators)
+        assert has_project_management, "Project management functionality should be preserved in app.py"
 
 
 class TestAppPyNativeExecution:
     """Test that app.py works with native execution environment."""
     
-    def test_environment_variable_access(self):
+    def test_environment_variable_access(self, app_py_content):
         """Test that app.py can access environment variables set by run.py."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for environment variable access
-                env_access_patterns = [
-                    'os.environ',
-                    'os.getenv',
-                    'environ.get'
-                ]
-                has_env_access = any(pattern in content for pattern in env_access_patterns)
-                assert has_env_access, "app.py should access environment variables for native execution"
+        content = app_py_content
+        # Check for environment variable access
+        env_access_patterns = [
+            'os.environ',
+            'os.getenv',
+            'environ.get'
+        ]
+        has_env_access = any(pattern in content for pattern in env_access_patterns)
+        assert has_env_access, "app.py should access environment variables for native execution"
     
-    def test_no_container_specific_code(self):
+    def test_no_container_specific_code(self, app_py_content):
         """Test that Docker container-specific code is removed."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for Docker container-specific code (excluding legitimate Streamlit containers)
-                docker_container_patterns = [
-                    'docker container',
-                    'container shutdown',
-                    'container main process',
-                    '/.dockerenv',
-                    '/app/',
-                    'DOCKER_',
-                    'container_id',
-                    'docker-compose'
-                ]
-                for pattern in docker_container_patterns:
-                    assert pattern.lower() not in content.lower(), f"Docker container pattern '{pattern}' should be removed from app.py"
+        content = app_py_content
+        # Check for Docker container-specific code (excluding legitimate Streamlit containers)
+        docker_container_patterns = [
+            'docker container',
+            'container shutdown',
+            'container main process',
+            '/.dockerenv',
+            '/app/',
+            'DOCKER_',
+            'container_id',
+            'docker-compose'
+        ]
+        for pattern in docker_container_patterns:
+            assert pattern.lower() not in content.lower(), f"Docker container pattern '{pattern}' should be removed from app.py"
     
-    def test_native_path_handling(self):
+    def test_native_path_handling(self, app_py_content):
         """Test that app.py handles native file paths correctly."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for native path handling
-                path_handling_indicators = [
-                    'Path(',
-                    'pathlib',
-                    'os.path',
-                    '.resolve()',
-                    '.exists()'
-                ]
-                has_path_handling = any(indicator in content for indicator in path_handling_indicators)
-                assert has_path_handling, "app.py should handle native file paths correctly"
+        content = app_py_content
+        # Check for native path handling
+        path_handling_indicators = [
+            'Path(',
+            'pathlib',
+            'os.path',
+            '.resolve()',
+            '.exists()'
+        ]
+        has_path_handling = any(indicator in content for indicator in path_handling_indicators)
+        assert has_path_handling, "app.py should handle native file paths correctly"
 
 
 class TestAppPyWorkflowIntegration:
     """Test that app.py integrates properly with workflow components."""
     
-    def test_core_module_integration(self):
+    def test_core_module_integration(self, app_py_content):
         """Test that app.py integrates with core module."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for core module integration
-                core_integration_patterns = [
-                    'from src.core import',
-                    'import src.core',
-                    'from core import',
-                    'import core'
-                ]
-                has_core_integration = any(pattern in content for pattern in core_integration_patterns)
-                assert has_core_integration, "app.py should integrate with core module"
+        content = app_py_content
+        # Check for core module integration
+        core_integration_patterns = [
+            'from src.core import',
+            'import src.core',
+            'from core import',
+            'import core'
+        ]
+        has_core_integration = any(pattern in content for pattern in core_integration_patterns)
+        assert has_core_integration, "app.py should integrate with core module"
     
-    def test_logic_module_integration(self):
+    def test_logic_module_integration(self, app_py_content):
         """Test that app.py integrates with logic module."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for logic module integration
-                logic_integration_patterns = [
-                    'from src.logic import',
-                    'import src.logic',
-                    'from logic import',
-                    'import logic'
-                ]
-                has_logic_integration = any(pattern in content for pattern in logic_integration_patterns)
-                assert has_logic_integration, "app.py should integrate with logic module"
+        content = app_py_content
+        # Check for logic module integration
+        logic_integration_patterns = [
+            'from src.logic import',
+            'import src.logic',
+            'from logic import',
+            'import logic'
+        ]
+        has_logic_integration = any(pattern in content for pattern in logic_integration_patterns)
+        assert has_logic_integration, "app.py should integrate with logic module"
     
-    def test_workflow_execution_preserved(self):
+    def test_workflow_execution_preserved(self, app_py_content):
         """Test that workflow execution functionality is preserved."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for workflow execution functionality
-                execution_patterns = [
-                    'run',
-                    'execute',
-                    'start',
-                    'workflow',
-                    'script'
-                ]
-                preserved_execution = [pattern for pattern in execution_patterns if pattern in content.lower()]
-                assert len(preserved_execution) > 0, "Workflow execution functionality should be preserved in app.py"
+        content = app_py_content
+        # Check for workflow execution functionality
+        execution_patterns = [
+            'run',
+            'execute',
+            'start',
+            'workflow',
+            'script'
+        ]
+        preserved_execution = [pattern for pattern in execution_patterns if pattern in content.lower()]
+        assert len(preserved_execution) > 0, "Workflow execution functionality should be preserved in app.py"
 
 
 class TestAppPyErrorHandling:
     """Test that app.py has proper error handling for native execution."""
     
-    def test_import_error_handling(self):
+    def test_import_error_handling(self, app_py_content):
         """Test that app.py handles import errors gracefully."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for import error handling
-                error_handling_patterns = [
-                    'try:',
-                    'except ImportError',
-                    'except Exception',
-                    'except:'
-                ]
-                has_error_handling = any(pattern in content for pattern in error_handling_patterns)
-                assert has_error_handling, "app.py should have proper error handling"
+        content = app_py_content
+        # Check for import error handling
+        error_handling_patterns = [
+            'try:',
+            'except ImportError',
+            'except Exception',
+            'except:'
+        ]
+        has_error_handling = any(pattern in content for pattern in error_handling_patterns)
+        assert has_error_handling, "app.py should have proper error handling"
     
-    def test_file_not_found_handling(self):
+    def test_file_not_found_handling(self, app_py_content):
         """Test that app.py handles file not found errors."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for file handling
-                file_handling_patterns = [
-                    'FileNotFoundError',
-                    '.exists()',
-                    'file not found',
-                    'path.exists'
-                ]
-                has_file_handling = any(pattern in content for pattern in file_handling_patterns)
-                assert has_file_handling, "app.py should handle file not found errors"
+        content = app_py_content
+        # Check for file handling
+        file_handling_patterns = [
+            'FileNotFoundError',
+            '.exists()',
+            'file not found',
+            'path.exists'
+        ]
+        has_file_handling = any(pattern in content for pattern in file_handling_patterns)
+        assert has_file_handling, "app.py should handle file not found errors"
 
 
 class TestAppPyPerformance:
     """Test that app.py performance is optimized for native execution."""
     
-    def test_no_unnecessary_docker_checks(self):
+    def test_no_unnecessary_docker_checks(self, app_py_content):
         """Test that unnecessary Docker checks are removed."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check that Docker checks are removed
-                docker_check_patterns = [
-                    'docker info',
-                    'docker ps',
-                    'docker version',
-                    'subprocess.run.*docker'
-                ]
-                for pattern in docker_check_patterns:
-                    assert pattern not in content, f"Docker check '{pattern}' should be removed from app.py"
+        content = app_py_content
+        # Check that Docker checks are removed
+        docker_check_patterns = [
+            'docker info',
+            'docker ps',
+            'docker version',
+            'subprocess.run.*docker'
+        ]
+        for pattern in docker_check_patterns:
+            assert pattern not in content, f"Docker check '{pattern}' should be removed from app.py"
     
-    def test_streamlined_startup(self):
+    def test_streamlined_startup(self, app_py_content):
         """Test that app.py has streamlined startup without Docker overhead."""
-        app_path = Path("app.py")
-        if app_path.exists():
-            with open(app_path, 'r') as f:
-                content = f.read()
-                # Check for streamlined startup
-                startup_indicators = [
-                    'main()',
-                    'if __name__',
-                    'st.set_page_config'
-                ]
-                has_streamlined_startup = any(indicator in content for indicator in startup_indicators)
-                assert has_streamlined_startup, "app.py should have streamlined startup"
+        content = app_py_content
+        # Check for streamlined startup
+        startup_indicators = [
+            'main()',
+            'if __name__',
+            'st.set_page_config'
+        ]
+        has_streamlined_startup = any(indicator in content for indicator in startup_indicators)
+        assert has_streamlined_startup, "app.py should have streamlined startup"
 
 
 if __name__ == "__main__":
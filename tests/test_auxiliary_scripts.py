@@ -36,6 +36,21 @@ class _RunResult:
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# workflow.yml for tmp_project, serialized once (C dumper when available)
+_WORKFLOW_YAML = yaml.dump(
+    {
+        "workflow_name": "Test Workflow",
+        "steps": [
+            {"id": "step_one", "name": "Step One", "script": "step_one.py"}
+        ],
+        "auxiliary_scripts": [
+            {"id": "aux_tool", "name": "Aux Tool", "script": "aux_tool.py"}
+        ],
+    },
+    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+)
+
+
 @pytest.fixture()
 def tmp_project(tmp_path):
     """
@@ -47,18 +62,7 @@ def tmp_project(tmp_path):
     - .snapshots/ directory
     """
     # workflow.yml
-    workflow_data = {
-        "workflow_name": "Test Workflow",
-        "steps": [
-            {"id": "step_one", "name": "Step One", "script": "step_one.py"}
-        ],
-        "auxiliary_scripts": [
-            {"id": "aux_tool", "name": "Aux Tool", "script": "aux_tool.py"}
-        ],
-    }
-    workflow_file = tmp_path / "workflow.yml"
-    with open(workflow_file, "w") as f:
-        yaml.dump(workflow_data, f)
+    (tmp_path / "workflow.yml").write_text(_WORKFLOW_YAML)
 
     # workflow_state.json
     state_file = tmp_path / "workflow_state.json"
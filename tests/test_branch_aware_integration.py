@@ -5,14 +5,12 @@ Tests the end-to-end workflow from branch detection to Docker operations.
 """
 
 import pytest
-import sys
 import os
 import subprocess
 from unittest.mock import patch, MagicMock
 
-# Add project root to path for imports
+# Project root, used as the cwd for the branch utility scripts
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
 
 from utils.branch_utils import (
     get_current_branch,
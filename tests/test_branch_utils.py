@@ -8,11 +8,7 @@ import pytest
 import subprocess
 from unittest.mock import patch, MagicMock
 from pathlib import Path
-import sys
-import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Import the module we're testing (will be created)
 from utils.branch_utils import (
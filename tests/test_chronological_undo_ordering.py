@@ -1,6 +1,4 @@
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from src.core import Project
 from src.logic import StateManager
@@ -65,9 +63,9 @@ class TestChronologicalUndoOrdering:
     """Test chronological undo ordering for cyclical workflows."""
 
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create a temporary project for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
         # Create workflow.yml with cyclical steps (16 -> 17 -> 16 -> 17)
         workflow_content = """
@@ -94,10 +92,7 @@ steps:
         with open(dummy_script, 'w') as f:
             f.write('print("Dummy script executed")\n')
         
-        yield temp_dir
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
+        return temp_dir
 
     def simulate_step_completion(self, project, step_id, run_number=None):
         """Simulate step completion by updating state, creating snapshots, and success marker.
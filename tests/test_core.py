@@ -1,10 +1,5 @@
-from pathlib import Path
-import sys
 import pytest
 
-# Add src to path to allow imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core import Project
 
 def test_project_init_with_external_script_path(tmp_path):
@@ -7,8 +7,6 @@ works correctly with the simplified undo system.
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 import json
 from src.core import Project
@@ -85,9 +83,9 @@ class TestCyclicalWorkflowUndo:
     """Test undo functionality for cyclical workflow steps 16-17."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create a temporary project for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
         # Create a minimal workflow.yml with steps 15-17
         workflow_content = """
@@ -140,10 +138,7 @@ steps:
         status_dir = temp_dir / ".workflow_status"
         status_dir.mkdir()
         
-        yield temp_dir
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
+        return temp_dir
     
     def create_success_marker(self, project_path: Path, script_name: str):
         """Create a success marker for a script."""
@@ -13,7 +13,8 @@ import ast
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
-import unittest
+
+import pytest
 
 
 class DependencyMapper:
@@ -86,10 +87,10 @@ class DependencyMapper:
             self.external_dependencies.add(module_name)
 
 
-class TestDependencyMapping(unittest.TestCase):
+class TestDependencyMapping:
     """Test dependency mapping for Mac + VNC implementation."""
     
-    def setUp(self):
+    def setup_method(self):
         self.mapper = DependencyMapper()
     
     def test_baseline_file_analysis(self):
@@ -172,13 +173,13 @@ class TestDependencyMapping(unittest.TestCase):
             ]
         }
         
-        self.assertIsInstance(baseline_analysis, dict)
-        self.assertEqual(len(baseline_analysis), 4)
+        assert isinstance(baseline_analysis, dict)
+        assert len(baseline_analysis) == 4
         
         # Verify no Smart Sync dependencies in baseline
         for file_name, analysis in baseline_analysis.items():
-            self.assertNotIn('smart_sync', str(analysis).lower(), 
-                           f"Baseline file {file_name} should not have Smart Sync dependencies")
+            assert 'smart_sync' not in str(analysis).lower(), \
+                f"Baseline file {file_name} should not have Smart Sync dependencies"
     
     def test_docker_era_enhancement_analysis(self):
         """Test analysis of Docker-era enhancement files."""
@@ -272,8 +273,8 @@ class TestDependencyMapping(unittest.TestCase):
             'integration_target': 'Merge Git functions into git_update_manager.py'
         }
         
-        self.assertIsInstance(enhancement_analysis, dict)
-        self.assertEqual(len(enhancement_analysis), 5)
+        assert isinstance(enhancement_analysis, dict)
+        assert len(enhancement_analysis) == 5
     
     def test_integration_mapping(self):
         """Test mapping of which enhancements integrate with which baseline files."""
@@ -323,9 +324,9 @@ class TestDependencyMapping(unittest.TestCase):
         
         # Verify integration mapping
         for target_file, mapping in integration_map.items():
-            self.assertIn('integrate_from', mapping)
-            self.assertIn('remove_integrations', mapping)
-            self.assertIn('new_functionality', mapping)
+            assert 'integrate_from' in mapping
+            assert 'remove_integrations' in mapping
+            assert 'new_functionality' in mapping
     
     def test_external_dependencies(self):
         """Test mapping of external dependencies for native Python."""
@@ -347,9 +348,9 @@ class TestDependencyMapping(unittest.TestCase):
             ]
         }
         
-        self.assertIsInstance(native_dependencies, dict)
-        self.assertIn('streamlit', str(native_dependencies['required']))
-        self.assertIn('docker', str(native_dependencies['remove']))
+        assert isinstance(native_dependencies, dict)
+        assert 'streamlit' in str(native_dependencies['required'])
+        assert 'docker' in str(native_dependencies['remove'])
     
     def test_file_removal_mapping(self):
         """Test mapping of files to be completely removed."""
@@ -374,8 +375,8 @@ class TestDependencyMapping(unittest.TestCase):
         }
         
         # Verify Smart Sync is marked for removal
-        self.assertIn('src/smart_sync.py', files_to_remove['docker_specific'])
-        self.assertIn('src/fatal_sync_checker.py', files_to_remove['docker_specific'])
+        assert 'src/smart_sync.py' in files_to_remove['docker_specific']
+        assert 'src/fatal_sync_checker.py' in files_to_remove['docker_specific']
     
     def test_new_files_mapping(self):
         """Test mapping of new files to be created."""
@@ -397,8 +398,8 @@ class TestDependencyMapping(unittest.TestCase):
             }
         }
         
-        self.assertIsInstance(new_files, dict)
-        self.assertEqual(len(new_files), 3)
+        assert isinstance(new_files, dict)
+        assert len(new_files) == 3
     
     def test_run_py_analysis(self):
         """Test analysis of run.py to understand Docker-era enhancement usage patterns."""
@@ -512,19 +513,17 @@ class TestDependencyMapping(unittest.TestCase):
         }
         
         # Verify run.py analysis structure
-        self.assertIn('docker_era_integrations', run_py_analysis)
-        self.assertIn('native_launcher_adaptation', run_py_analysis)
-        self.assertIn('critical_insights', run_py_analysis)
+        assert 'docker_era_integrations' in run_py_analysis
+        assert 'native_launcher_adaptation' in run_py_analysis
+        assert 'critical_insights' in run_py_analysis
         
         # Verify Smart Sync is correctly identified for removal
         smart_sync_analysis = run_py_analysis['docker_era_integrations']['smart_sync']
-        self.assertIn('Remove: ALL Smart Sync functionality',
-                     str(smart_sync_analysis['adaptation_for_native']))
+        assert 'Remove: ALL Smart Sync functionality' in str(smart_sync_analysis['adaptation_for_native'])
         
         # Verify scripts_updater is correctly identified for preservation
         scripts_analysis = run_py_analysis['docker_era_integrations']['scripts_updater']
-        self.assertIn('Keep: All functionality (100% Docker-independent)',
-                     str(scripts_analysis['adaptation_for_native']))
+        assert 'Keep: All functionality (100% Docker-independent)' in str(scripts_analysis['adaptation_for_native'])
     
     def test_native_launcher_requirements(self):
         """Test requirements for the new native Python launcher based on run.py analysis."""
@@ -569,16 +568,16 @@ class TestDependencyMapping(unittest.TestCase):
         }
         
         # Verify native launcher requirements
-        self.assertIn('core_functionality', native_launcher_requirements)
-        self.assertIn('preserve_from_run_py', native_launcher_requirements)
-        self.assertIn('remove_from_run_py', native_launcher_requirements)
-        self.assertIn('new_functionality', native_launcher_requirements)
+        assert 'core_functionality' in native_launcher_requirements
+        assert 'preserve_from_run_py' in native_launcher_requirements
+        assert 'remove_from_run_py' in native_launcher_requirements
+        assert 'new_functionality' in native_launcher_requirements
         
         # Verify Smart Sync is not in preserve list
         preserve_items = str(native_launcher_requirements['preserve_from_run_py'])
-        self.assertNotIn('smart_sync', preserve_items.lower())
-        self.assertNotIn('Smart Sync', preserve_items)
+        assert 'smart_sync' not in preserve_items.lower()
+        assert 'Smart Sync' not in preserve_items
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -7,14 +7,9 @@ sync issues and exits with appropriate codes when fatal errors are detected.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 
-# Add src to path to allow imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.fatal_sync_checker import check_fatal_sync_errors
 
 
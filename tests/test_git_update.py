@@ -1,11 +1,8 @@
-import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
-
-# Add src to path to allow imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import requests
 
 from src.git_update_manager import create_update_managers, detect_script_repository_config, GitUpdateManager
 
@@ -71,4 +68,97 @@ def test_detect_repo_config():
     assert "sip_scripts_workflow_gui" in dev_config["repo_url"]
     assert "sip_scripts_workflow_gui" in prod_config["repo_url"]  # Both use same repo URL now
     # Default case
-    assert "sip_scripts_workflow_gui" in other_config["repo_url"]
\ No newline at end of file
+    assert "sip_scripts_workflow_gui" in other_config["repo_url"]
+
+
+@pytest.fixture(scope="module")
+def scripts_manager():
+    """A scripts manager for pure version comparisons; never touches the filesystem."""
+    return GitUpdateManager("scripts", Path("/nonexistent/sip_scripts_dev"))
+
+
+@pytest.mark.parametrize("current, latest, expected", [
+    ("1.0.0", "1.0.1", True),
+    ("1.0.1", "1.0.0", False),
+    ("1.2.3", "1.2.3", False),
+    ("v1.9.0", "v1.10.0", True),
+    ("1.0", "1.0.0", False),
+    ("1.0", "1.0.1", True),
+    ("2.0.0", "1.99.99", False),
+])
+def test_compare_versions_tags(scripts_manager, current, latest, expected):
+    """Tests semantic version comparison for tag-based (scripts) repositories."""
+    assert scripts_manager.compare_versions(current, latest) is expected
+
+
+def _mock_response(status_code, payload=None, headers=None):
+    """A requests.Response stand-in limited to the Response interface."""
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    return response
+
+
+def test_get_latest_release_uses_session(tmp_path):
+    """Tests that release lookups go through the manager's pooled HTTP session."""
+    manager = GitUpdateManager("scripts", tmp_path / "sip_scripts_dev")
+
+    with patch.object(manager, "_session") as mock_session:
+        mock_session.get.return_value = _mock_response(200, {"tag_name": "v1.2.3"})
+
+        release = manager.get_latest_release(timeout=5)
+
+    assert release["tag_name"] == "v1.2.3"
+    mock_session.get.assert_called_once_with(
+        "https://api.github.com/repos/rrmalmstrom/sip_scripts_workflow_gui/releases/latest",
+        headers={},
+        timeout=5
+    )
+
+
+def test_get_latest_release_304_returns_cached_release(tmp_path):
+    """Tests that an unchanged release (HTTP 304) reuses the previous payload."""
+    manager = GitUpdateManager("scripts", tmp_path / "sip_scripts_dev")
+
+    with patch.object(manager, "_session") as mock_session:
+        mock_session.get.return_value = _mock_response(200, {"tag_name": "v1.2.3"}, {"ETag": '"abc123"'})
+        release = manager.get_latest_release()
+
+        second = mock_session.get.return_value = _mock_response(304)
+        cached = manager.get_latest_release()
+
+    assert cached is release
+    second.json.assert_not_called()
+    assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"abc123"'}
+
+
+def test_clear_cache_drops_conditional_release_state(tmp_path):
+    """Tests that clearing the cache forces a full (unconditional) release lookup."""
+    manager = GitUpdateManager("scripts", tmp_path / "sip_scripts_dev")
+
+    with patch.object(manager, "_session") as mock_session:
+        mock_session.get.return_value = _mock_response(200, {"tag_name": "v1.2.3"}, {"ETag": '"abc123"'})
+        manager.get_latest_release()
+
+        manager.clear_cache()
+        manager.get_latest_release()
+
+    assert mock_session.get.call_args.kwargs["headers"] == {}
+
+
+def test_session_is_created_lazily_and_closed(tmp_path):
+    """Tests that the HTTP session only exists between the first lookup and close()."""
+    manager = GitUpdateManager("scripts", tmp_path / "sip_scripts_dev")
+    assert manager._session is None
+
+    with patch("src.git_update_manager.requests.Session") as mock_session_cls:
+        mock_session = mock_session_cls.return_value
+        mock_session.get.return_value = _mock_response(404)
+        manager.get_latest_release()
+        manager.get_latest_release()
+
+    mock_session_cls.assert_called_once_with()
+    manager.close()
+    mock_session.close.assert_called_once_with()
+    assert manager._session is None
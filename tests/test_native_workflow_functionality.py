@@ -8,16 +8,10 @@ components that laboratory users depend on.
 """
 
 import pytest
-import tempfile
-import shutil
-import sys
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core import Project, Workflow
 from src.logic import StateManager, SnapshotManager, ScriptRunner
 from src.update_detector import UpdateDetector
@@ -29,9 +23,9 @@ class TestNativeWorkflowCore:
     """Test core workflow functionality in native mode."""
 
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create a temporary project for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
         # Create workflow.yml
         workflow_content = """
@@ -62,10 +56,7 @@ steps:
             with open(script_file, 'w') as f:
                 f.write(f'#!/usr/bin/env python3\nprint("Executing {script_name}")\n')
         
-        yield temp_dir
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
+        return temp_dir
 
     def test_project_initialization_native(self, temp_project):
         """Test that Project initializes correctly in native mode."""
@@ -268,9 +259,9 @@ class TestNativeWorkflowIntegration:
     """Test integration between workflow components in native mode."""
 
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create a temporary project for integration testing."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
         # Create workflow.yml with re-runnable steps
         workflow_content = """
@@ -301,10 +292,7 @@ steps:
             with open(script_file, 'w') as f:
                 f.write(f'#!/usr/bin/env python3\nprint("Executing {script_name}")\n')
         
-        yield temp_dir
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
+        return temp_dir
 
     def test_workflow_step_progression(self, temp_project):
         """Test workflow step progression in native mode."""
@@ -413,40 +401,33 @@ class TestNativeEnvironmentIntegration:
 class TestNativeErrorHandling:
     """Test error handling in native mode."""
 
-    def test_missing_workflow_file_handling(self):
+    def test_missing_workflow_file_handling(self, tmp_path):
         """Test handling of missing workflow file."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
-        try:
-            # Try to create project without workflow.yml
-            with pytest.raises(FileNotFoundError):
-                Project(temp_dir, script_path=temp_dir / "scripts")
-        finally:
-            shutil.rmtree(temp_dir)
+        # Try to create project without workflow.yml
+        with pytest.raises(FileNotFoundError):
+            Project(temp_dir, script_path=temp_dir / "scripts")
 
-    def test_missing_scripts_directory_handling(self):
+    def test_missing_scripts_directory_handling(self, tmp_path):
         """Test handling of missing scripts directory."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
-        try:
-            # Create workflow.yml but no scripts directory
-            workflow_content = """
+        # Create workflow.yml but no scripts directory
+        workflow_content = """
 workflow_name: "Test Workflow"
 steps:
   - id: "step_1"
     name: "Step 1"
     script: "test.py"
 """
-            workflow_file = temp_dir / "workflow.yml"
-            with open(workflow_file, 'w') as f:
-                f.write(workflow_content)
-            
-            # Should handle missing scripts directory gracefully
-            project = Project(temp_dir, script_path=temp_dir / "scripts")
-            assert project.script_path == temp_dir / "scripts"
-            
-        finally:
-            shutil.rmtree(temp_dir)
+        workflow_file = temp_dir / "workflow.yml"
+        with open(workflow_file, 'w') as f:
+            f.write(workflow_content)
+        
+        # Should handle missing scripts directory gracefully
+        project = Project(temp_dir, script_path=temp_dir / "scripts")
+        assert project.script_path == temp_dir / "scripts"
 
 
 if __name__ == "__main__":
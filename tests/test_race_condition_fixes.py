@@ -9,7 +9,6 @@ Tests the comprehensive three-layer defense against race conditions:
 
 import pytest
 import json
-import tempfile
 import threading
 import time
 import os
@@ -210,10 +209,10 @@ class TestRetryLogic:
 class TestComprehensiveLogging:
     """Test comprehensive logging in handle_step_result()"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_project(self, tmp_path):
         """Set up test project and mocks"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_path = Path(self.temp_dir)
+        self.project_path = tmp_path
         self.workflow_file = self.project_path / "workflow.yml"
         
         # Create test workflow
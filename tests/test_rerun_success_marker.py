@@ -27,8 +27,6 @@ These tests exercise both fixes at the unit level without launching real scripts
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 
 from src.core import Project
@@ -64,9 +62,9 @@ if __name__ == "__main__":
 
 
 @pytest.fixture
-def project_dir():
+def project_dir(tmp_path):
     """Temporary project directory with a minimal workflow and mock scripts."""
-    tmp = Path(tempfile.mkdtemp())
+    tmp = tmp_path
     (tmp / "workflow.yml").write_text(WORKFLOW_YAML)
 
     scripts_dir = tmp / "scripts"
@@ -74,8 +72,7 @@ def project_dir():
     (scripts_dir / "mock_rerun_script.py").write_text(SNAPSHOT_ITEMS_SCRIPT)
     (scripts_dir / "mock_normal_script.py").write_text(SNAPSHOT_ITEMS_SCRIPT)
 
-    yield tmp
-    shutil.rmtree(tmp)
+    return tmp
 
 
 @pytest.fixture
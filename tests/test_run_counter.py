@@ -1,7 +1,4 @@
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from src.core import Project
 from app import get_script_run_count
 
@@ -9,9 +6,9 @@ class TestRunCounter:
     """Test the get_script_run_count function."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create a temporary project for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path
         
         # Create minimal workflow.yml
         workflow_content = """
@@ -30,8 +27,7 @@ steps:
         scripts_dir.mkdir()
         (scripts_dir / "test_script.py").write_text('print("test")')
         
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return temp_dir
     
     def test_run_count_zero_initially(self, temp_project):
         """Test that run count is 0 for steps that haven't been completed."""
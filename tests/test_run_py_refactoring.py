@@ -9,16 +9,12 @@ Following TDD methodology:
 3. Validate and optimize (REFACTOR)
 """
 
-import os
 import pytest
 import sys
 import subprocess
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 
 class TestRunPyRefactoredStructure:
     """Test that run.py has the correct refactored structure."""
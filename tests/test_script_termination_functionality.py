@@ -28,27 +28,16 @@ from enhanced_debug_logger import log_info, log_error, debug_enabled
 os.environ['WORKFLOW_DEBUG'] = 'true'
 
 
-class TestScriptTerminationFunctionality:
-    """Test suite for script termination functionality."""
-    
-    @pytest.fixture
-    def temp_project_dir(self):
-        """Create a temporary project directory with workflow files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            
-            # Create workflow.yml
-            workflow_content = """
+# Workflow definition and long-running script written into each test project
+_WORKFLOW_YML = """
 workflow_name: "Test Workflow"
 steps:
   - id: "test_step"
     name: "Test Long Running Script"
     script: "long_running_test.py"
 """
-            (project_path / "workflow.yml").write_text(workflow_content)
-            
-            # Create a long-running test script
-            script_content = """
+
+_TEST_SCRIPT_SRC = """
 import time
 import sys
 
@@ -63,9 +52,24 @@ for i in range(100):
 
 print("Script completed normally")
 """
+
+
+class TestScriptTerminationFunctionality:
+    """Test suite for script termination functionality."""
+    
+    @pytest.fixture
+    def temp_project_dir(self):
+        """Create a temporary project directory with workflow files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+            
+            # Create workflow.yml
+            (project_path / "workflow.yml").write_text(_WORKFLOW_YML)
+            
+            # Create a long-running test script
             scripts_dir = project_path / "scripts"
             scripts_dir.mkdir()
-            (scripts_dir / "long_running_test.py").write_text(script_content)
+            (scripts_dir / "long_running_test.py").write_text(_TEST_SCRIPT_SRC)
             
             yield project_path
     
@@ -222,39 +226,37 @@ print("Script completed normally")
         mock_process.pid = 12345
         mock_process.poll.return_value = None  # Process is running
         
+        # The runner belongs to this test's project, so install the mocks
+        # directly instead of stacking patch.object contexts (stop() resets
+        # process to None, so it is reinstalled for each scenario)
+        
         # Test ProcessLookupError scenario
+        script_runner.process = mock_process
+        script_runner.is_running_flag = mock_flag = Mock()
+        mock_flag.is_set.return_value = True
         with patch('os.getpgid', side_effect=ProcessLookupError("Process not found")):
-            with patch.object(script_runner, 'process', mock_process):
-                with patch.object(script_runner, 'is_running_flag') as mock_flag:
-                    mock_flag.is_set.return_value = True
-                    mock_flag.clear = Mock()
-                    
-                    # This should not raise an exception
-                    script_runner.stop()
-                    
-                    # Verify the flag was cleared
-                    mock_flag.clear.assert_called_once()
+            # This should not raise an exception
+            script_runner.stop()
+        
+        # Verify the flag was cleared
+        mock_flag.clear.assert_called_once()
         
         log_info("ProcessLookupError handling test completed")
         
         # Test PermissionError scenario
-        with patch('os.getpgid', return_value=12345):
-            with patch('os.killpg', side_effect=PermissionError("Permission denied")):
-                with patch.object(script_runner, 'process', mock_process):
-                    with patch.object(script_runner, 'is_running_flag') as mock_flag:
-                        mock_flag.is_set.return_value = True
-                        mock_flag.clear = Mock()
-                        
-                        # Mock the fallback terminate method
-                        mock_process.terminate = Mock()
-                        mock_process.wait = Mock()
-                        
-                        # This should not raise an exception and should use fallback
-                        script_runner.stop()
-                        
-                        # Verify fallback was called
-                        mock_process.terminate.assert_called_once()
-                        mock_flag.clear.assert_called_once()
+        script_runner.process = mock_process
+        script_runner.is_running_flag = mock_flag = Mock()
+        mock_flag.is_set.return_value = True
+        mock_process.terminate = Mock()
+        mock_process.wait = Mock()
+        with patch.multiple('os', getpgid=Mock(return_value=12345),
+                            killpg=Mock(side_effect=PermissionError("Permission denied"))):
+            # This should not raise an exception and should use fallback
+            script_runner.stop()
+        
+        # Verify fallback was called
+        mock_process.terminate.assert_called_once()
+        mock_flag.clear.assert_called_once()
         
         log_info("PermissionError handling test completed")
     
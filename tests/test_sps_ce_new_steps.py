@@ -13,13 +13,9 @@ New steps to be added:
 """
 
 from pathlib import Path
-import sys
 import pytest
 import yaml
 
-# Ensure src/ is importable
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core import Workflow
 
 # ---------------------------------------------------------------------------
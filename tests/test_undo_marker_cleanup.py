@@ -23,8 +23,6 @@ test_chronological_undo_ordering.py, imported here to avoid duplication.
 """
 
 import pytest
-import tempfile
-import shutil
 import zipfile
 import json
 import datetime
@@ -60,9 +58,9 @@ SNAPSHOT_ITEMS = []
 
 
 @pytest.fixture
-def project_dir():
+def project_dir(tmp_path):
     """Temporary project directory with a minimal workflow and mock scripts."""
-    tmp = Path(tempfile.mkdtemp())
+    tmp = tmp_path
     (tmp / "workflow.yml").write_text(WORKFLOW_YAML)
 
     scripts_dir = tmp / "scripts"
@@ -70,8 +68,7 @@ def project_dir():
     (scripts_dir / "script_a.py").write_text(SNAPSHOT_ITEMS_SCRIPT)
     (scripts_dir / "script_b.py").write_text(SNAPSHOT_ITEMS_SCRIPT)
 
-    yield tmp
-    shutil.rmtree(tmp)
+    return tmp
 
 
 @pytest.fixture
@@ -5,14 +5,8 @@ Tests the enhanced update detection that uses current branch instead of hardcode
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import patch, MagicMock
 
-# Add project root to path for imports
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
 from src.update_detector import UpdateDetector
 
 